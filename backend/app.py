@@ -3,12 +3,17 @@ from __future__ import annotations
 
 import json
 import logging
-import re
+import os
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
@@ -17,6 +22,28 @@ try:  # pragma: no cover - optional dependency handling
 except ImportError:  # pragma: no cover
     joblib = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency handling
+    import xgboost as xgb
+except ImportError:  # pragma: no cover
+    xgb = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency handling
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency handling
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency handling
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
 
 LOGGER = logging.getLogger("credit_card_dashboard")
 if not LOGGER.handlers:
@@ -32,7 +59,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "outputs"
 FEATURE_IMPORTANCE_PATH = DATA_DIR / "feature_importance.json"
 MONTHLY_FEATURES_PATH = DATA_DIR / "monthly_features.csv"
+MONTHLY_FEATURES_PARQUET_PATH = DATA_DIR / "monthly_features.parquet"
 MODEL_PATH = DATA_DIR / "xgb_spending_model.joblib"
+NATIVE_MODEL_PATH = DATA_DIR / "xgb_spending_model.ubj"
 
 DEFAULT_FEATURES: List[Dict[str, Any]] = [
     {"name": "NumberOfTransactionsPerMonth", "importance": 0.6683},
@@ -78,10 +107,87 @@ REQUIRED_PREDICT_FIELDS: List[str] = [
     "MonthlyCreditUtilizationRate",
 ]
 
+_HEALTH_JSON = json.dumps(
+    {"status": "ok", "service": "credit_card_dashboard"}, separators=(",", ":")
+).encode("utf-8")
+_DEFAULT_FEATURES_JSON = json.dumps(
+    {"features": DEFAULT_FEATURES}, separators=(",", ":")
+).encode("utf-8")
+_DEFAULT_OVERVIEW_JSON = json.dumps(DEFAULT_OVERVIEW, separators=(",", ":")).encode("utf-8")
+
+CUSTOMER_COLUMN_CANDIDATES = ("CustomerID", "CustomerId", "customer_id", "customerID")
+PARQUET_ROW_GROUP_SIZE = 50_000
+PARQUET_SOURCE_METADATA_KEY = b"credit_card_dashboard.source_signature"
+_MISSING_TEXT_KEY = "\U0010ffff"
+_OVERVIEW_COLUMN_KEYS = frozenset(
+    column.lower()
+    for column in (
+        *CUSTOMER_COLUMN_CANDIDATES,
+        "YearMonth",
+        "MonthlyTotalSpending",
+        "NumberOfTransactionsPerMonth",
+    )
+)
+
+MAX_PREDICT_BATCH_SIZE = 1000
+
+_AVG_TXN_INDEX = REQUIRED_PREDICT_FIELDS.index("AvgTransactionAmount")
+_TXN_COUNT_INDEX = REQUIRED_PREDICT_FIELDS.index("NumberOfTransactionsPerMonth")
+_MAX_SPEND_INDEX = REQUIRED_PREDICT_FIELDS.index("MaxMonthlySpend")
+_WEEKEND_SPEND_INDEX = REQUIRED_PREDICT_FIELDS.index("TotalWeekendSpending")
+_WEEKEND_RATIO_INDEX = REQUIRED_PREDICT_FIELDS.index("WeekendSpendingRatio")
+
+_MONTHLY_SNAPSHOT: Optional[_MonthlySnapshot] = None
 _MODEL: Optional[Any] = None
+_BOOSTER: Optional[Any] = None
+_BOOSTER_ITERATION_RANGE: Tuple[int, int] = (0, 0)
+_BOOSTER_FEATURE_ORDER: Optional[np.ndarray] = None
 _MODEL_LOAD_ATTEMPTED = False
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that parses and serializes with orjson instead of the stdlib."""
+
+    def _orjson_option(self) -> int:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_option()).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits; the stdlib encoder does not.
+            return super().dumps(obj)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._orjson_option())
+        except orjson.JSONEncodeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+class _MonthlySnapshot(NamedTuple):
+    """Monthly features and their lookup structures from one version of the CSV."""
+
+    frame: pd.DataFrame
+    table: Optional["pa.Table"]
+    month_positions: Dict[str, np.ndarray]
+    customer_aliases: Dict[str, Tuple[str, ...]]
+    customer_column: Optional[str]
+    signature: Tuple[int, int]
+
+
 def load_json_safe(path: Path) -> Optional[Dict[str, Any]]:
     """Safely load a JSON file, returning None when unavailable or invalid."""
     if not path.exists():
@@ -102,15 +208,19 @@ def load_json_safe(path: Path) -> Optional[Dict[str, Any]]:
     return None
 
 
-def load_csv_safe(path: Path) -> Optional[pd.DataFrame]:
+def load_csv_safe(
+    path: Path,
+    usecols: Optional[Any] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+) -> Optional[pd.DataFrame]:
     """Safely load a CSV file, returning None when unavailable or invalid."""
     if not path.exists():
         LOGGER.info("CSV file not found at %s", path)
         return None
 
     try:
-        dataframe = pd.read_csv(path)
-    except (OSError, pd.errors.ParserError) as exc:
+        dataframe = pd.read_csv(path, usecols=usecols, dtype=dtype)
+    except (OSError, ValueError) as exc:
         LOGGER.warning("Failed to load CSV from %s: %s", path, exc)
         return None
 
@@ -121,6 +231,121 @@ def load_csv_safe(path: Path) -> Optional[pd.DataFrame]:
     return dataframe
 
 
+def ensure_monthly_parquet() -> Optional[Path]:
+    """Return an up-to-date, sorted Parquet copy of the monthly features CSV."""
+    if pq is None or not MONTHLY_FEATURES_PATH.exists():
+        return None
+
+    parquet_path = MONTHLY_FEATURES_PARQUET_PATH
+    source_signature = _file_signature(MONTHLY_FEATURES_PATH)
+    if source_signature is None:
+        return None
+    if _parquet_source_signature(parquet_path) == source_signature:
+        return parquet_path
+
+    dataframe = load_csv_safe(MONTHLY_FEATURES_PATH)
+    if dataframe is None:
+        return None
+
+    dataframe = _prepare_monthly_frame(dataframe)
+    if not isinstance(dataframe.index, pd.MultiIndex):
+        LOGGER.warning("Monthly features lack key columns; skipping Parquet cache")
+        return None
+
+    temp_path: Optional[Path] = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=parquet_path.parent, prefix=parquet_path.name, suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_path = Path(temp_file.name)
+            table = pa.Table.from_pandas(dataframe.reset_index(drop=True), preserve_index=False)
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    PARQUET_SOURCE_METADATA_KEY: "{}:{}".format(*source_signature).encode(),
+                }
+            )
+            pq.write_table(table, temp_file, row_group_size=PARQUET_ROW_GROUP_SIZE)
+        temp_path.chmod(stat.S_IMODE(MONTHLY_FEATURES_PATH.stat().st_mode))
+        temp_path.replace(parquet_path)
+    except (OSError, pa.ArrowException) as exc:
+        LOGGER.warning("Failed to write Parquet cache to %s: %s", parquet_path, exc)
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+        return None
+
+    LOGGER.info("Monthly features cached as Parquet at %s", parquet_path)
+    return parquet_path
+
+
+def _parquet_source_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return the CSV signature a Parquet cache was built from, or None if unknown."""
+    if not path.exists():
+        return None
+
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        mtime_ns, size = metadata[PARQUET_SOURCE_METADATA_KEY].decode().split(":")
+        return int(mtime_ns), int(size)
+    except (OSError, pa.ArrowException, KeyError, ValueError):
+        return None
+
+
+def get_monthly_snapshot() -> Optional[_MonthlySnapshot]:
+    """Return the cached monthly features snapshot, reloading when the CSV changes."""
+    global _MONTHLY_SNAPSHOT
+
+    signature = _file_signature(MONTHLY_FEATURES_PATH)
+    if signature is None:
+        LOGGER.info("CSV file not found at %s", MONTHLY_FEATURES_PATH)
+        _MONTHLY_SNAPSHOT = None
+        return None
+
+    snapshot = _MONTHLY_SNAPSHOT
+    if snapshot is not None and snapshot.signature == signature:
+        return snapshot
+
+    dataframe: Optional[pd.DataFrame] = None
+    presorted = False
+    parquet_path = ensure_monthly_parquet()
+    if parquet_path is not None:
+        try:
+            dataframe = pd.read_parquet(parquet_path, engine="pyarrow")
+            presorted = True
+        except (OSError, pa.ArrowException) as exc:
+            LOGGER.warning("Failed to load Parquet from %s: %s", parquet_path, exc)
+
+    if dataframe is None:
+        dataframe = load_csv_safe(MONTHLY_FEATURES_PATH)
+
+    if dataframe is None:
+        _MONTHLY_SNAPSHOT = None
+        return None
+
+    dataframe = _prepare_monthly_frame(dataframe, presorted=presorted)
+    customer_column = _identify_column(dataframe.columns, CUSTOMER_COLUMN_CANDIDATES)
+    if customer_column is None:
+        LOGGER.warning("Customer identifier column not found for monthly features")
+    if "YearMonth" not in dataframe.columns:
+        LOGGER.warning("YearMonth column not found for monthly features")
+    month_positions = (
+        dataframe.groupby(level="YearMonth", sort=False).indices
+        if isinstance(dataframe.index, pd.MultiIndex)
+        else {}
+    )
+    snapshot = _MonthlySnapshot(
+        frame=dataframe,
+        table=_to_contiguous_table(dataframe),
+        month_positions=month_positions,
+        customer_aliases=_customer_aliases(dataframe),
+        customer_column=customer_column,
+        signature=signature,
+    )
+    _MONTHLY_SNAPSHOT = snapshot
+    LOGGER.info("Monthly features loaded into memory (%d rows)", len(dataframe))
+    return snapshot
+
+
 def get_model() -> Optional[Any]:
     """Load and cache the prediction model, returning None if unavailable."""
     global _MODEL, _MODEL_LOAD_ATTEMPTED
@@ -130,6 +355,11 @@ def get_model() -> Optional[Any]:
 
     _MODEL_LOAD_ATTEMPTED = True
 
+    native_booster = _load_native_booster()
+    if native_booster is not None and _use_booster(native_booster):
+        _MODEL = native_booster
+        return _MODEL
+
     if joblib is None:
         LOGGER.info("joblib is not available; using mock predictions")
         return None
@@ -145,13 +375,85 @@ def get_model() -> Optional[Any]:
         LOGGER.warning("Failed to load model from %s: %s", MODEL_PATH, exc)
         _MODEL = None
 
+    if xgb is not None and isinstance(_MODEL, xgb.XGBRegressor):
+        _use_booster(_MODEL.get_booster())
+
     return _MODEL
 
 
-def create_app() -> Flask:
+def _use_booster(booster: Any) -> bool:
+    """Predict through the booster when its features match the request fields."""
+    global _BOOSTER, _BOOSTER_ITERATION_RANGE, _BOOSTER_FEATURE_ORDER
+
+    feature_names = booster.feature_names
+    if feature_names is None or list(feature_names) == REQUIRED_PREDICT_FIELDS:
+        feature_order = None
+    elif sorted(feature_names) == sorted(REQUIRED_PREDICT_FIELDS):
+        feature_order = np.array(
+            [REQUIRED_PREDICT_FIELDS.index(name) for name in feature_names], dtype=np.intp
+        )
+    else:
+        LOGGER.warning("Model features do not match the prediction fields: %s", feature_names)
+        return False
+
+    _BOOSTER, _BOOSTER_FEATURE_ORDER = booster, feature_order
+    _BOOSTER_ITERATION_RANGE = _iteration_range(booster)
+    return True
+
+
+def _load_native_booster() -> Optional[Any]:
+    """Load the native XGBoost model, skipping it when older than the pickle."""
+    if xgb is None or not NATIVE_MODEL_PATH.exists():
+        return None
+
+    try:
+        if (
+            MODEL_PATH.exists()
+            and NATIVE_MODEL_PATH.stat().st_mtime_ns < MODEL_PATH.stat().st_mtime_ns
+        ):
+            LOGGER.info("Native model at %s is stale; ignoring it", NATIVE_MODEL_PATH)
+            return None
+        booster = xgb.Booster(model_file=str(NATIVE_MODEL_PATH))
+    except (OSError, xgb.core.XGBoostError) as exc:
+        LOGGER.warning("Failed to load model from %s: %s", NATIVE_MODEL_PATH, exc)
+        return None
+
+    LOGGER.info("Model loaded from %s", NATIVE_MODEL_PATH)
+    return booster
+
+
+def _iteration_range(booster: Any) -> Tuple[int, int]:
+    """Return the tree range predictions should use, honouring early stopping."""
+    best_iteration = getattr(booster, "best_iteration", None)
+    if best_iteration is None:
+        return (0, 0)
+    return (0, int(best_iteration) + 1)
+
+
+def warm_up_model() -> None:
+    """Load the model and run one dummy prediction so no request pays for it."""
+    model = get_model()
+    if model is None:
+        return
+
+    try:
+        _predict_with_model(model, np.zeros((1, len(REQUIRED_PREDICT_FIELDS)), dtype=np.float32))
+    except Exception as exc:  # pragma: no cover - defensive
+        LOGGER.warning("Model warm-up prediction failed: %s", exc)
+
+
+def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     CORS(app, resources={r"/api/*": {"origins": "http://localhost:3000"}})
+    app.config["EAGER_LOAD"] = os.environ.get("DASHBOARD_EAGER_LOAD", "1") != "0"
+    if config:
+        app.config.update(config)
+    if app.config["EAGER_LOAD"]:
+        get_monthly_snapshot()
+        warm_up_model()
 
     @app.after_request
     def log_request(response):  # type: ignore[override]
@@ -171,32 +473,27 @@ def create_app() -> Flask:
 
     @app.route("/api/health", methods=["GET"])
     def health_check():
-        return jsonify({"status": "ok", "service": "credit_card_dashboard"})
+        return Response(_HEALTH_JSON, mimetype="application/json")
 
     @app.route("/api/feature-importance", methods=["GET"])
     def feature_importance():
-        data = load_json_safe(FEATURE_IMPORTANCE_PATH)
-
-        if data and isinstance(data.get("features"), Iterable):
-            raw_features = data["features"]
-            validated_features = _validate_feature_importance(raw_features)
-            if validated_features:
-                return jsonify({"features": validated_features})
+        validated_features = _cached_feature_importance(
+            FEATURE_IMPORTANCE_PATH, _file_signature(FEATURE_IMPORTANCE_PATH)
+        )
+        if validated_features:
+            return jsonify({"features": validated_features})
 
         LOGGER.info("Using default feature importance values")
-        return jsonify({"features": DEFAULT_FEATURES})
+        return Response(_DEFAULT_FEATURES_JSON, mimetype="application/json")
 
     @app.route("/api/metrics/overview", methods=["GET"])
     def metrics_overview():
-        dataframe = load_csv_safe(MONTHLY_FEATURES_PATH)
-
-        if dataframe is not None:
-            metrics = _calculate_metrics_overview(dataframe)
-            if metrics:
-                return jsonify(metrics)
+        metrics = _cached_metrics_overview(_file_signature(MONTHLY_FEATURES_PATH))
+        if metrics:
+            return jsonify(metrics)
 
         LOGGER.info("Returning default overview metrics")
-        return jsonify(DEFAULT_OVERVIEW)
+        return Response(_DEFAULT_OVERVIEW_JSON, mimetype="application/json")
 
     @app.route("/api/monthly-features", methods=["GET"])
     def monthly_features():
@@ -229,54 +526,35 @@ def create_app() -> Flask:
         if not MONTHLY_FEATURES_PATH.exists():
             return jsonify({"error": "Monthly features data not found"}), 404
 
-        try:
-            dataframe = pd.read_csv(MONTHLY_FEATURES_PATH)
-        except (OSError, pd.errors.ParserError) as exc:
-            LOGGER.warning("Failed to load monthly features data: %s", exc)
-            return jsonify({"error": "Unable to load monthly features data"}), 500
+        start_index = (page_value - 1) * page_size_value
+        end_index = start_index + page_size_value
 
-        customer_column = _identify_column(
-            dataframe.columns,
-            ("CustomerID", "CustomerId", "customer_id", "customerID"),
-        )
+        snapshot = get_monthly_snapshot()
+        if snapshot is None:
+            return jsonify({"error": "Unable to load monthly features data"}), 500
 
-        if customer_column is None:
-            LOGGER.warning("Customer identifier column not found for monthly features")
+        if snapshot.customer_column is None:
             return jsonify({"error": "CustomerID column not available"}), 500
 
-        if "YearMonth" not in dataframe.columns:
-            LOGGER.warning("YearMonth column not found for monthly features")
+        if "YearMonth" not in snapshot.frame.columns:
             return jsonify({"error": "YearMonth column not available"}), 500
 
-        filtered = dataframe.copy()
-
-        if customer_id:
-            filtered = filtered[
-                filtered[customer_column].astype(str).str.strip() == customer_id
-            ]
-
-        if year_month:
-            filtered = filtered[filtered["YearMonth"].astype(str) == year_month]
-
-        filtered = filtered.sort_values(
-            by=[customer_column, "YearMonth"],
-            ascending=[True, True],
-            kind="mergesort",
-        ).reset_index(drop=True)
+        positions = _select_monthly_positions(snapshot, customer_id, year_month)
+        total_rows = len(positions)
+        page_positions = positions[start_index:end_index]
+        if start_index >= total_rows:
+            rows: List[Dict[str, Any]] = []
+        elif snapshot.table is not None:
+            rows = _take_table_rows(snapshot.table, page_positions).to_pylist()
+        else:
+            paginated = snapshot.frame.iloc[page_positions]
+            paginated = paginated.astype(object).where(paginated.notna(), None)
+            rows = paginated.to_dict(orient="records")
 
-        total_rows = int(filtered.shape[0])
         total_pages = (
             (total_rows + page_size_value - 1) // page_size_value if total_rows else 0
         )
 
-        start_index = (page_value - 1) * page_size_value
-        end_index = start_index + page_size_value
-
-        paginated = filtered.iloc[start_index:end_index]
-        paginated = paginated.where(pd.notnull(paginated), None)
-
-        rows = paginated.to_dict(orient="records")
-
         response_payload = {
             "page": page_value,
             "page_size": page_size_value,
@@ -293,39 +571,131 @@ def create_app() -> Flask:
         if payload is None:
             return jsonify({"error": "Request body must be JSON"}), 400
 
-        missing_fields = [field for field in REQUIRED_PREDICT_FIELDS if field not in payload]
-        if missing_fields:
-            message = ", ".join(missing_fields)
-            LOGGER.warning("Prediction request missing fields: %s", message)
+        is_batch = isinstance(payload, list)
+        records = payload if is_batch else [payload]
+
+        if not records:
+            return jsonify({"error": "Request body must not be an empty list"}), 400
+
+        if len(records) > MAX_PREDICT_BATCH_SIZE:
             return (
-                jsonify({"error": f"missing fields: {missing_fields}"}),
+                jsonify({"error": f"batch size must not exceed {MAX_PREDICT_BATCH_SIZE}"}),
                 400,
             )
 
-        try:
-            numeric_payload = {
-                field: _coerce_to_float(payload[field], field) for field in REQUIRED_PREDICT_FIELDS
-            }
-        except ValueError as exc:
-            LOGGER.warning("Invalid payload value: %s", exc)
-            return jsonify({"error": str(exc)}), 400
+        features = np.empty((len(records), len(REQUIRED_PREDICT_FIELDS)), dtype=np.float64)
+        for row_index, record in enumerate(records):
+            prefix = f"row {row_index}: " if is_batch else ""
+            if not isinstance(record, dict):
+                return jsonify({"error": f"{prefix}input must be a JSON object"}), 400
+
+            missing_fields = [field for field in REQUIRED_PREDICT_FIELDS if field not in record]
+            if missing_fields:
+                message = ", ".join(missing_fields)
+                LOGGER.warning("Prediction request missing fields: %s", message)
+                return (
+                    jsonify({"error": f"{prefix}missing fields: {missing_fields}"}),
+                    400,
+                )
 
+            try:
+                features[row_index] = [
+                    _coerce_to_float(record[field], field) for field in REQUIRED_PREDICT_FIELDS
+                ]
+            except ValueError as exc:
+                LOGGER.warning("Invalid payload value: %s", exc)
+                return jsonify({"error": f"{prefix}{exc}"}), 400
+
+        predictions: Optional[List[float]] = None
         model = get_model()
         if model is not None:
             try:
-                input_frame = pd.DataFrame([numeric_payload])
-                prediction_result = model.predict(input_frame)[0]
-                prediction_value = float(prediction_result)
-                return jsonify({"prediction": round(prediction_value, 2)})
+                predictions = [
+                    round(float(value), 2) for value in _predict_with_model(model, features)
+                ]
             except Exception as exc:  # pragma: no cover - defensive
                 LOGGER.warning("Model prediction failed, using mock formula: %s", exc)
 
-        prediction_value = _mock_prediction(numeric_payload)
-        return jsonify({"prediction": prediction_value})
+        if predictions is None:
+            predictions = [_mock_prediction(row) for row in features]
+
+        if is_batch:
+            return jsonify({"predictions": predictions})
+        return jsonify({"prediction": predictions[0]})
 
     return app
 
 
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) pair of a file, or None when it is missing."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+@lru_cache(maxsize=4)
+def _cached_feature_importance(
+    path: Path, signature: Optional[Tuple[int, int]]
+) -> Optional[List[Dict[str, float]]]:
+    """Load and validate feature importance once per version of the file."""
+    data = load_json_safe(path)
+    if data and isinstance(data.get("features"), Iterable):
+        return _validate_feature_importance(data["features"])
+    return None
+
+
+@lru_cache(maxsize=1)
+def _cached_metrics_overview(signature: Optional[Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+    """Compute overview metrics once per version of the monthly features file."""
+    dataframe = _load_overview_frame()
+    if dataframe is None:
+        return None
+    return _calculate_metrics_overview(dataframe)
+
+
+def _load_overview_frame() -> Optional[pd.DataFrame]:
+    """Load only the monthly feature columns the overview metrics need."""
+    parquet_path = ensure_monthly_parquet()
+    if parquet_path is not None:
+        try:
+            columns = [
+                name for name in pq.read_schema(parquet_path).names if _is_overview_column(name)
+            ]
+            return pd.read_parquet(
+                parquet_path,
+                engine="pyarrow",
+                columns=columns,
+                read_dictionary=[name for name in columns if _is_key_column(name)],
+            )
+        except (OSError, pa.ArrowException) as exc:
+            LOGGER.warning("Failed to load Parquet from %s: %s", parquet_path, exc)
+
+    return load_csv_safe(
+        MONTHLY_FEATURES_PATH,
+        usecols=_is_overview_column,
+        dtype={column: "category" for column in (*CUSTOMER_COLUMN_CANDIDATES, "YearMonth")},
+    )
+
+
+def _is_overview_column(column: str) -> bool:
+    """Return whether a column feeds the overview metrics."""
+    return column.lower() in _OVERVIEW_COLUMN_KEYS
+
+
+def _is_key_column(column: str) -> bool:
+    """Return whether a column is the customer or month key."""
+    return column == "YearMonth" or column in CUSTOMER_COLUMN_CANDIDATES
+
+
+def _count_unique(series: pd.Series) -> int:
+    """Count distinct non-null values, reusing the categories of categoricals."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return len(series.cat.categories)
+    return int(series.nunique(dropna=True))
+
+
 def _coerce_to_float(value: Any, field_name: str) -> float:
     """Convert a value to float, raising ValueError when conversion fails."""
     if isinstance(value, (int, float)):
@@ -371,17 +741,14 @@ def _calculate_metrics_overview(dataframe: pd.DataFrame) -> Optional[Dict[str, A
     try:
         total_rows = int(len(dataframe))
 
-        customer_column = _identify_column(
-            dataframe.columns,
-            ("CustomerID", "CustomerId", "customer_id", "customerID"),
-        )
+        customer_column = _identify_column(dataframe.columns, CUSTOMER_COLUMN_CANDIDATES)
         if customer_column is None:
             raise KeyError("Customer identifier column not found")
-        unique_customers = int(dataframe[customer_column].nunique(dropna=True))
+        unique_customers = _count_unique(dataframe[customer_column])
 
         if "YearMonth" not in dataframe.columns:
             raise KeyError("YearMonth column not found")
-        months_covered = int(dataframe["YearMonth"].nunique(dropna=True))
+        months_covered = _count_unique(dataframe["YearMonth"])
 
         mean_monthly_spending = _mean_of_column(dataframe, "MonthlyTotalSpending")
         avg_txn_per_month = _mean_of_column(
@@ -400,6 +767,115 @@ def _calculate_metrics_overview(dataframe: pd.DataFrame) -> Optional[Dict[str, A
         return None
 
 
+def _prepare_monthly_frame(dataframe: pd.DataFrame, presorted: bool = False) -> pd.DataFrame:
+    """Sort by customer and month and index on lookup copies of both keys."""
+    customer_column = _identify_column(dataframe.columns, CUSTOMER_COLUMN_CANDIDATES)
+    if customer_column is None or "YearMonth" not in dataframe.columns:
+        return dataframe
+
+    dataframe = dataframe.set_index(
+        [
+            _customer_index_key(dataframe[customer_column]),
+            dataframe["YearMonth"].astype("string").fillna(_MISSING_TEXT_KEY),
+        ]
+    )
+    if not presorted:
+        dataframe = dataframe.sort_index(kind="mergesort")
+    return dataframe
+
+
+def _customer_index_key(series: pd.Series) -> pd.Series:
+    """Return the customer lookup key, with missing values sorting last."""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.fillna(np.inf) if series.hasnans else series
+    return series.astype("string").fillna(_MISSING_TEXT_KEY)
+
+
+def _customer_aliases(dataframe: pd.DataFrame) -> Dict[str, Tuple[str, ...]]:
+    """Map stripped customer identifiers to the padded values stored for them."""
+    if not isinstance(dataframe.index, pd.MultiIndex):
+        return {}
+
+    customers = dataframe.index.levels[0]
+    if pd.api.types.is_numeric_dtype(customers.dtype):
+        return {}
+
+    aliases: Dict[str, Tuple[str, ...]] = {}
+    for value in customers[customers != customers.str.strip()]:
+        aliases[value.strip()] = (*aliases.get(value.strip(), ()), value)
+    return aliases
+
+
+def _coerce_customer_id(customer_id: str, dtype: Any) -> Optional[Any]:
+    """Convert a customer_id filter to the index dtype, or None if none can match."""
+    if not pd.api.types.is_numeric_dtype(dtype):
+        return customer_id
+
+    try:
+        value = dtype.type(customer_id)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return value if str(value) == customer_id else None
+
+
+def _select_monthly_positions(
+    snapshot: _MonthlySnapshot, customer_id: Optional[str], year_month: Optional[str]
+) -> Sequence[int]:
+    """Return positions of snapshot rows matching the optional filters."""
+    dataframe = snapshot.frame
+    all_rows = range(len(dataframe))
+    if not customer_id:
+        if year_month:
+            return snapshot.month_positions.get(year_month, all_rows[0:0])
+        return all_rows
+
+    customer_key = _coerce_customer_id(customer_id, dataframe.index.levels[0].dtype)
+    if customer_key is None:
+        return all_rows[0:0]
+
+    matches: List[Sequence[int]] = []
+    for key in (customer_key, *snapshot.customer_aliases.get(customer_key, ())):
+        try:
+            location = dataframe.index.get_loc((key, year_month) if year_month else key)
+        except KeyError:
+            continue
+        matches.append(_location_positions(location, all_rows))
+
+    if not matches:
+        return all_rows[0:0]
+    if len(matches) == 1:
+        return matches[0]
+    return np.sort(np.concatenate([np.asarray(match, dtype=np.intp) for match in matches]))
+
+
+def _location_positions(location: Any, all_rows: range) -> Sequence[int]:
+    """Convert an index ``get_loc`` result to row positions."""
+    if isinstance(location, slice):
+        return all_rows[location]
+    if isinstance(location, (int, np.integer)):
+        return all_rows[location : location + 1]
+    return np.flatnonzero(location)
+
+
+def _to_contiguous_table(dataframe: pd.DataFrame) -> Optional["pa.Table"]:
+    """Convert a frame to an Arrow table with one chunk per column."""
+    if pa is None:
+        return None
+
+    try:
+        return pa.Table.from_pandas(dataframe, preserve_index=False).combine_chunks()
+    except pa.ArrowException as exc:
+        LOGGER.warning("Failed to convert monthly features to Arrow: %s", exc)
+        return None
+
+
+def _take_table_rows(table: "pa.Table", positions: Sequence[int]) -> "pa.Table":
+    """Return table rows at the given positions, slicing zero-copy for ranges."""
+    if isinstance(positions, range) and positions.step == 1:
+        return table.slice(positions.start, len(positions))
+    return table.take(np.asarray(positions, dtype=np.intp))
+
+
 def _identify_column(columns: Iterable[str], candidates: Iterable[str]) -> Optional[str]:
     """Return the first matching column from candidates."""
     normalized_columns = {col.lower(): col for col in columns}
@@ -422,19 +898,52 @@ def _mean_of_column(dataframe: pd.DataFrame, column_name: str) -> float:
     return float(valid_series.mean())
 
 
-def _mock_prediction(features: Dict[str, float]) -> float:
-    """Generate a deterministic mock prediction based on request features."""
+def _predict_with_model(model: Any, features: np.ndarray) -> np.ndarray:
+    """Predict for a 2D feature array, going straight to the XGBoost booster."""
+    if _BOOSTER is not None:
+        if _BOOSTER_FEATURE_ORDER is not None:
+            features = features[:, _BOOSTER_FEATURE_ORDER]
+        return _BOOSTER.inplace_predict(
+            features.astype(np.float32, copy=False),
+            iteration_range=_BOOSTER_ITERATION_RANGE,
+        )
+    return model.predict(_model_input(model, features))
+
+
+def _model_input(model: Any, features: np.ndarray) -> Any:
+    """Return model input for a 2D feature array, named if the model expects it."""
+    if hasattr(model, "feature_names_in_"):
+        return pd.DataFrame(features, columns=REQUIRED_PREDICT_FIELDS, copy=False)
+    return features
+
+
+def _mock_prediction_kernel(features: np.ndarray) -> float:
+    """Compute the unrounded mock prediction for one ordered feature vector."""
     txn_component = (
-        features["NumberOfTransactionsPerMonth"]
-        * features["AvgTransactionAmount"]
-        * (1 + features["WeekendSpendingRatio"] * 0.1)
+        features[_TXN_COUNT_INDEX]
+        * features[_AVG_TXN_INDEX]
+        * (1 + features[_WEEKEND_RATIO_INDEX] * 0.1)
         * 0.3
     )
-    peak_component = features["MaxMonthlySpend"] * 0.2
-    weekend_component = features["TotalWeekendSpending"] * 0.1
+    peak_component = features[_MAX_SPEND_INDEX] * 0.2
+    weekend_component = features[_WEEKEND_SPEND_INDEX] * 0.1
 
     prediction = txn_component + peak_component + weekend_component
-    return round(max(prediction, 0.0), 2)
+    return max(prediction, 0.0)
+
+
+if njit is not None:  # pragma: no cover - depends on optional numba
+    try:
+        _jitted_kernel = njit(cache=True)(_mock_prediction_kernel)
+        _jitted_kernel(np.zeros(len(REQUIRED_PREDICT_FIELDS), dtype=np.float64))
+        _mock_prediction_kernel = _jitted_kernel
+    except Exception as exc:  # pragma: no cover - defensive
+        LOGGER.warning("Failed to JIT-compile mock prediction: %s", exc)
+
+
+def _mock_prediction(features: np.ndarray) -> float:
+    """Generate a deterministic mock prediction from a feature vector."""
+    return round(float(_mock_prediction_kernel(features)), 2)
 
 
 def _is_valid_year_month(value: str) -> bool:
@@ -442,12 +951,14 @@ def _is_valid_year_month(value: str) -> bool:
     if not isinstance(value, str):
         return False
 
-    match = re.fullmatch(r"(\d{4})-(\d{2})", value)
-    if not match:
+    if len(value) != 7 or value[4] != "-":
+        return False
+
+    year, month = value[:4], value[5:]
+    if not (year.isdecimal() and month.isdecimal()):
         return False
 
-    month = int(match.group(2))
-    return 1 <= month <= 12
+    return 1 <= int(month) <= 12
 
 
 app = create_app()
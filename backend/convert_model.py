@@ -0,0 +1,40 @@
+"""Convert the pickled XGBoost model to XGBoost's native UBJSON format.
+
+Run once after training, from the ``backend`` directory::
+
+    python convert_model.py
+
+The API prefers the converted ``xgb_spending_model.ubj``, which loads
+straight into a booster without unpickling the scikit-learn wrapper.
+"""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("DASHBOARD_EAGER_LOAD", "0")
+
+from app import LOGGER, MODEL_PATH, NATIVE_MODEL_PATH, joblib, xgb  # noqa: E402
+
+
+def main() -> int:
+    """Write the native model next to the pickle, returning an exit code."""
+    if joblib is None or xgb is None:
+        LOGGER.error("joblib and xgboost are required to convert the model")
+        return 1
+
+    if not MODEL_PATH.exists():
+        LOGGER.error("Model file not found at %s", MODEL_PATH)
+        return 1
+
+    model = joblib.load(MODEL_PATH)
+    if not isinstance(model, xgb.XGBRegressor):
+        LOGGER.error("Expected an XGBRegressor, got %s", type(model).__name__)
+        return 1
+
+    model.get_booster().save_model(str(NATIVE_MODEL_PATH))
+    LOGGER.info("Native model written to %s", NATIVE_MODEL_PATH)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,26 @@
+"""Gunicorn settings for serving the credit card dashboard API.
+
+Start the server from the repository root with::
+
+    gunicorn -c backend/gunicorn.conf.py
+
+The app is preloaded in the master process so the model, the in-memory
+monthly features and the Parquet cache are built once and shared with the
+forked workers through copy-on-write pages. The server binds to
+``GUNICORN_BIND`` when set, otherwise to ``0.0.0.0:$PORT`` (port 5000 by
+default), as platforms that run the Procfile expect. Any setting can be
+overridden with ``GUNICORN_CMD_ARGS``, e.g. ``GUNICORN_CMD_ARGS="-w 4"``.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from pathlib import Path
+
+chdir = str(Path(__file__).resolve().parent)
+wsgi_app = "wsgi:app"
+preload_app = True
+
+bind = os.environ.get("GUNICORN_BIND") or f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", min(multiprocessing.cpu_count(), 4)))
+timeout = 30
@@ -0,0 +1,9 @@
+"""Pytest configuration for the backend API tests."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("DASHBOARD_EAGER_LOAD", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
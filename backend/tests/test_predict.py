@@ -0,0 +1,105 @@
+"""Tests for /api/predict with XGBoost models trained on other column layouts."""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+joblib = pytest.importorskip("joblib")
+xgb = pytest.importorskip("xgboost")
+
+import app as app_module  # noqa: E402
+
+REORDERED_FIELDS = list(reversed(app_module.REQUIRED_PREDICT_FIELDS))
+
+
+def _train_model(columns: List[str]) -> Any:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.uniform(0, 100, (300, len(columns))), columns=columns)
+    target = frame.iloc[:, 0] * 3 + frame.iloc[:, 1] - frame.iloc[:, 2]
+    return xgb.XGBRegressor(n_estimators=20).fit(frame, target)
+
+
+def _payload(offset: float = 0.0) -> Dict[str, float]:
+    return {
+        field: offset + index * 6.5
+        for index, field in enumerate(app_module.REQUIRED_PREDICT_FIELDS)
+    }
+
+
+@pytest.fixture
+def install_model(tmp_path, monkeypatch):
+    """Point the app at a freshly pickled model and clear the cached one."""
+    monkeypatch.setattr(app_module, "MODEL_PATH", tmp_path / "xgb_spending_model.joblib")
+    monkeypatch.setattr(app_module, "NATIVE_MODEL_PATH", tmp_path / "xgb_spending_model.ubj")
+    monkeypatch.setattr(app_module, "_MODEL", None)
+    monkeypatch.setattr(app_module, "_BOOSTER", None)
+    monkeypatch.setattr(app_module, "_BOOSTER_ITERATION_RANGE", (0, 0))
+    monkeypatch.setattr(app_module, "_BOOSTER_FEATURE_ORDER", None)
+    monkeypatch.setattr(app_module, "_MODEL_LOAD_ATTEMPTED", False)
+
+    def install(model: Any, native: bool = False) -> Any:
+        joblib.dump(model, app_module.MODEL_PATH)
+        if native:
+            model.get_booster().save_model(str(app_module.NATIVE_MODEL_PATH))
+        return model
+
+    return install
+
+
+@pytest.fixture
+def client():
+    return app_module.create_app({"EAGER_LOAD": False}).test_client()
+
+
+def test_predict_reorders_features_for_reordered_model(install_model, client):
+    model = install_model(_train_model(REORDERED_FIELDS))
+    payloads = [_payload(), _payload(offset=3.0)]
+
+    response = client.post("/api/predict", json=payloads)
+
+    expected = model.predict(pd.DataFrame(payloads)[REORDERED_FIELDS])
+    assert response.status_code == 200
+    assert response.get_json()["predictions"] == [round(float(value), 2) for value in expected]
+    assert app_module._BOOSTER is not None
+
+
+def test_predict_falls_back_to_mock_for_unknown_features(install_model, client):
+    columns = [f"feature_{index}" for index in range(len(app_module.REQUIRED_PREDICT_FIELDS))]
+    install_model(_train_model(columns))
+    payload = _payload()
+
+    response = client.post("/api/predict", json=payload)
+
+    features = np.array([payload[field] for field in app_module.REQUIRED_PREDICT_FIELDS])
+    assert response.status_code == 200
+    assert response.get_json()["prediction"] == app_module._mock_prediction(features)
+    assert app_module._BOOSTER is None
+
+
+def test_native_model_reorders_features_for_reordered_model(install_model, client):
+    model = install_model(_train_model(REORDERED_FIELDS), native=True)
+    payload = _payload()
+
+    response = client.post("/api/predict", json=payload)
+
+    expected = model.predict(pd.DataFrame([payload])[REORDERED_FIELDS])
+    assert response.status_code == 200
+    assert response.get_json()["prediction"] == round(float(expected[0]), 2)
+    assert isinstance(app_module._MODEL, xgb.Booster)
+
+
+def test_native_model_with_unknown_features_is_not_used(install_model, client):
+    columns = [f"feature_{index}" for index in range(len(app_module.REQUIRED_PREDICT_FIELDS))]
+    install_model(_train_model(columns), native=True)
+    payload = _payload()
+
+    response = client.post("/api/predict", json=payload)
+
+    features = np.array([payload[field] for field in app_module.REQUIRED_PREDICT_FIELDS])
+    assert response.status_code == 200
+    assert response.get_json()["prediction"] == app_module._mock_prediction(features)
+    assert isinstance(app_module._MODEL, xgb.XGBRegressor)
+    assert app_module._BOOSTER is None
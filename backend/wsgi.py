@@ -0,0 +1,6 @@
+"""WSGI entry point for serving the credit card dashboard API."""
+from __future__ import annotations
+
+from app import app
+
+__all__ = ["app"]